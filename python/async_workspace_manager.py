@@ -0,0 +1,187 @@
+import importlib.util
+from typing import Dict, List, Optional, Union, Any
+from workspace import Workspace
+from utils import json_utils
+from utils.api import APIError, _build_headers, _err, _error_text, _StreamDecoder
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; create_role_workspaces falls back to aiohttp or requests
+    httpx = None
+
+# HTTP/2 needs the h2 package, installed with httpx[http2]. httpx only negotiates it over TLS
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+
+class AsyncWorkspaceManager:
+    """
+    An asyncio counterpart to WorkspaceManager backed by httpx.
+    All requests share one pooled httpx.AsyncClient, using up to 64 HTTP/1.1 connections. HTTP/2 is
+    only used for https:// endpoints behind an h2-capable proxy, and needs the h2 package; AnythingLLM's
+    own server speaks HTTP/1.1.
+    """
+
+    def __init__(self, base_endpoint: str = "http://localhost:3001", api_key: str = None):
+        """
+        Initialize an AsyncWorkspaceManager object.
+
+        Args:
+            base_endpoint (str, optional): Base API endpoint. Defaults to "http://localhost:3001".
+            api_key (str, optional): API key for authentication. Defaults to None.
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for AsyncWorkspaceManager. Install it with: pip install 'httpx[http2]'")
+
+        self.base_endpoint = base_endpoint.rstrip('/')
+        self.api_key = api_key
+        self.workspaces = {}
+        self._client = httpx.AsyncClient(
+            base_url=f"{self.base_endpoint}/api",
+            headers=_build_headers(api_key),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=None
+        )
+
+    async def __aenter__(self) -> 'AsyncWorkspaceManager':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx client and its connections."""
+        await self._client.aclose()
+
+    async def _request(self, method: str, endpoint: str, data: Dict = None) -> Dict[str, Any]:
+        """
+        Make a request to the API.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint, relative to /api
+            data (Dict, optional): Request body. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: Response data
+
+        Raises:
+            APIError: If the request fails
+        """
+        # Serialized once with json_utils; the client's default headers already set Content-Type
+        body = json_utils.dumps(data) if data is not None else None
+
+        try:
+            response = await self._client.request(method, endpoint, content=body)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise _err(f"{method} request failed: {str(e)}", e) from e
+
+        # Handle empty responses
+        if not response.content.strip():
+            return {}
+
+        try:
+            return json_utils.loads(response.content)
+        except ValueError as json_err:
+            raise APIError(f"Failed to parse JSON response: {str(json_err)}", response.status_code,
+                           _error_text(response.content)) from json_err
+
+    async def create_workspace(self, config: Union[str, Dict]) -> Workspace:
+        """
+        Create a new workspace from a configuration.
+
+        Args:
+            config (Union[str, Dict]): JSON string or dictionary with workspace settings
+
+        Returns:
+            Workspace: The created workspace object
+
+        Raises:
+            APIError: If the API request fails
+        """
+        workspace = Workspace.from_json(config, self.base_endpoint, self.api_key)
+        data = await self._request("POST", "v1/workspace/new", workspace._payload())
+        workspace._update_from_response(data)
+
+        # Store the workspace in the manager
+        self.workspaces[workspace.workspace_slug] = workspace
+
+        return workspace
+
+    def get_workspace(self, slug: str) -> Optional[Workspace]:
+        """
+        Get a workspace by its slug.
+
+        Args:
+            slug (str): Workspace slug
+
+        Returns:
+            Optional[Workspace]: The workspace object if found, None otherwise
+        """
+        return self.workspaces.get(slug)
+
+    async def list_workspaces(self) -> List[Dict[str, Any]]:
+        """
+        List all workspaces from the API.
+
+        Returns:
+            List[Dict[str, Any]]: List of workspace details
+
+        Raises:
+            APIError: If the API request fails
+        """
+        data = await self._request("GET", "v1/workspaces")
+        return data.get('workspaces', [])
+
+    async def stream_chat(self, workspace: Workspace, message: str, session_id: str = None,
+                          attachments: List = None):
+        """
+        Stream a chat message to a workspace.
+
+        Args:
+            workspace (Workspace): Workspace to chat with
+            message (str): Message to send
+            session_id (str, optional): Session ID for chat continuity. Defaults to None.
+            attachments (List, optional): List of attachments. Defaults to None.
+
+        Yields:
+            Dict[str, Any]: Streaming response chunks
+
+        Raises:
+            ValueError: If workspace slug is not set
+            APIError: If the API request fails
+        """
+        if not workspace.workspace_slug:
+            raise ValueError("Workspace slug is not set. Cannot stream chat message.")
+
+        endpoint = f"v1/workspace/{workspace.workspace_slug}/stream-chat"
+
+        body = json_utils.dumps(workspace._chat_payload(message, session_id, attachments))
+
+        try:
+            async with self._client.stream("POST", endpoint, content=body) as response:
+                if response.is_error:
+                    raise APIError(f"Streaming POST request failed: {response.status_code} {response.reason_phrase}",
+                                   response.status_code, _error_text(await response.aread()))
+
+                decoder = _StreamDecoder()
+                async for chunk in response.aiter_bytes():
+                    for parsed in decoder.feed(chunk):
+                        yield parsed
+                for parsed in decoder.flush():
+                    yield parsed
+        except httpx.HTTPError as e:
+            raise APIError(f"Streaming POST request failed: {str(e)}") from e
+
+    def __str__(self) -> str:
+        """
+        String representation of the workspace manager.
+
+        Returns:
+            str: String representation
+        """
+        return f"AsyncWorkspaceManager(workspaces={len(self.workspaces)})"
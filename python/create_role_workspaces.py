@@ -1,8 +1,45 @@
 import os
-import json
-from typing import List, Dict, Any
-from workspace import Workspace
-from workspace_manager import WorkspaceManager
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Any, Tuple
+from workspace import Workspace, WORKSPACE_CONFIG_SCHEMA
+from workspace_manager import WorkspaceManager, DEFAULT_CONCURRENCY
+from async_workspace_manager import AsyncWorkspaceManager, httpx
+from utils import json_utils
+from utils.api import AsyncAPIClient
+
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is optional; without it only from_json's checks apply
+    fastjsonschema = None
+
+ROLES_DIR = os.path.join(os.path.dirname(__file__), 'roles')
+
+# Upper bound on threads used to read and parse role files
+MAX_LOAD_WORKERS = 16
+
+# Compiled once so invalid role files are rejected locally instead of by a server round trip
+_validate_config = fastjsonschema.compile(WORKSPACE_CONFIG_SCHEMA) if fastjsonschema else None
+
+@functools.lru_cache(maxsize=1)
+def _list_role_files(roles_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    List the JSON files in a roles directory.
+
+    Cached on the directory's modification time, which changes whenever a file is added,
+    removed or renamed.
+
+    Args:
+        roles_dir (str): Path to the roles directory
+        mtime_ns (int): Modification time of the directory, used as part of the cache key
+
+    Returns:
+        Tuple[str, ...]: File paths
+    """
+    with os.scandir(roles_dir) as entries:
+        return tuple(entry.path for entry in entries if entry.name.endswith('.json') and entry.is_file())
 
 def get_role_files() -> List[str]:
     """
@@ -11,57 +48,245 @@ def get_role_files() -> List[str]:
     Returns:
         List[str]: List of file paths
     """
-    roles_dir = os.path.join(os.path.dirname(__file__), 'roles')
-    if not os.path.exists(roles_dir):
-        raise FileNotFoundError(f"Roles directory not found: {roles_dir}")
+    try:
+        mtime_ns = os.stat(ROLES_DIR).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Roles directory not found: {ROLES_DIR}") from None
+
+    return list(_list_role_files(ROLES_DIR, mtime_ns))
 
-    role_files = []
-    for filename in os.listdir(roles_dir):
-        if filename.endswith('.json'):
-            role_files.append(os.path.join(roles_dir, filename))
+@functools.lru_cache(maxsize=128)
+def _parse_role(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Read and parse a role file, cached on the file's modification time and size.
 
-    return role_files
+    Args:
+        file_path (str): Path to the role JSON file
+        mtime_ns (int): Modification time of the file, used as part of the cache key
+        size (int): Size of the file, used as part of the cache key
 
-def create_role_workspaces(base_endpoint: str, api_key: str = None) -> List[Workspace]:
+    Returns:
+        Dict[str, Any]: Workspace configuration
     """
-    Create workspaces from all JSON files in the roles directory.
+    # Parsed straight from the raw bytes, with no text-mode decoding step
+    return json_utils.load_file(file_path)
+
+def _load_role(file_path: str) -> Dict[str, Any]:
+    """
+    Load a role file, reusing the parsed configuration while the file is unchanged.
+
+    Args:
+        file_path (str): Path to the role JSON file
+
+    Returns:
+        Dict[str, Any]: Workspace configuration
+    """
+    st = os.stat(file_path)
+    # Copy so callers can't modify the cached configuration
+    return dict(_parse_role(file_path, st.st_mtime_ns, st.st_size))
+
+# Creates a workspace from a configuration
+WorkspaceCreator = Callable[[Dict[str, Any]], Awaitable[Workspace]]
+
+@contextlib.asynccontextmanager
+async def _workspace_creator(base_endpoint: str, api_key: str, executor: Executor) -> AsyncIterator[WorkspaceCreator]:
+    """
+    Open the best available HTTP backend for creating workspaces.
+
+    Prefers AsyncWorkspaceManager (httpx), then AsyncAPIClient (aiohttp), which both send requests from
+    the event loop over a shared connection pool, and finally the synchronous WorkspaceManager run on the
+    executor.
+
+    Args:
+        base_endpoint (str): Base API endpoint
+        api_key (str): API key for authentication
+        executor (Executor): Executor used by the synchronous fallback
+
+    Yields:
+        WorkspaceCreator: Coroutine function creating a workspace from a configuration
+    """
+    if httpx is not None:
+        async with AsyncWorkspaceManager(base_endpoint=base_endpoint, api_key=api_key) as manager:
+            yield manager.create_workspace
+        return
+
+    try:
+        client = AsyncAPIClient(base_endpoint=base_endpoint, api_key=api_key)
+    except ImportError:
+        client = None
+
+    if client is not None:
+        async def create(config: Dict[str, Any]) -> Workspace:
+            # Same payload as WorkspaceManager.create_workspace, sent through the shared async session
+            workspace = Workspace.from_json(config, client.base_endpoint, client.api_key)
+            workspace._update_from_response(await client.post("v1/workspace/new", workspace._payload()))
+            return workspace
+
+        async with client:
+            yield create
+        return
+
+    loop = asyncio.get_running_loop()
+    with WorkspaceManager(base_endpoint=base_endpoint, api_key=api_key) as manager:
+        async def create(config: Dict[str, Any]) -> Workspace:
+            return await loop.run_in_executor(executor, manager.create_workspace, config)
+
+        yield create
+
+async def _load_one(executor: Executor, file_path: str) -> Dict[str, Any]:
+    """
+    Load and validate a single role file.
+
+    Args:
+        executor (Executor): Executor used to read the role file off the event loop
+        file_path (str): Path to the role JSON file
+
+    Returns:
+        Dict[str, Any]: Workspace configuration
+    """
+    print(f"Creating workspace from {os.path.basename(file_path)}...")
+    config = await asyncio.get_running_loop().run_in_executor(executor, _load_role, file_path)
+
+    # Print the request payload for debugging
+    print(f"  Request payload: {config}")
+
+    if _validate_config is not None:
+        _validate_config(config)
+
+    return config
+
+async def _create_one(create: WorkspaceCreator, sem: asyncio.Semaphore, name_locks: Dict[str, asyncio.Lock],
+                      executor: Executor, file_path: str) -> Workspace:
+    """
+    Create a single workspace from a role file.
+
+    Role files sharing a workspace name are created one at a time, so the server can give each a
+    unique slug.
+
+    Args:
+        create (WorkspaceCreator): Shared workspace creator
+        sem (asyncio.Semaphore): Semaphore bounding the number of in-flight requests
+        name_locks (Dict[str, asyncio.Lock]): Lock per lower-cased workspace name, shared by all role files
+        executor (Executor): Executor used to read the role file off the event loop
+        file_path (str): Path to the role JSON file
+
+    Returns:
+        Workspace: Created workspace
+    """
+    config = await _load_one(executor, file_path)
+
+    # The server looks a slug up before inserting it, so creates sharing a name must not overlap.
+    # The name lock is taken before the semaphore so waiting files don't hold a request slot
+    name = str(config.get('workspace_name', '')).lower()
+    async with name_locks.setdefault(name, asyncio.Lock()):
+        async with sem:
+            return await create(config)
+
+async def _create_bulk(base_endpoint: str, api_key: str, executor: Executor,
+                       role_files: List[str]) -> List[Any]:
+    """
+    Create workspaces from role files with a single bulk-new request.
+
+    Role files that fail to load or validate are left out of the request. The request is
+    all-or-nothing on the server, so if it fails none of the remaining workspaces exist.
+
+    Args:
+        base_endpoint (str): Base API endpoint
+        api_key (str): API key for authentication
+        executor (Executor): Executor used to read the role files and send the request
+        role_files (List[str]): Paths to the role JSON files
+
+    Returns:
+        List[Any]: Created workspace or exception for each role file, in order
+    """
+    results = await asyncio.gather(*(_load_one(executor, file_path) for file_path in role_files),
+                                   return_exceptions=True)
+    configs = [result for result in results if not isinstance(result, BaseException)]
+    if not configs:
+        return results
+
+    try:
+        with WorkspaceManager(base_endpoint=base_endpoint, api_key=api_key) as manager:
+            created = iter(await asyncio.get_running_loop().run_in_executor(
+                executor, manager.create_workspaces_bulk, configs))
+    except Exception as e:
+        # The whole batch shares the outcome of the one request
+        return [result if isinstance(result, BaseException) else e for result in results]
+
+    return [result if isinstance(result, BaseException) else next(created) for result in results]
+
+async def create_role_workspaces_async(base_endpoint: str, api_key: str = None,
+                                       concurrency: int = DEFAULT_CONCURRENCY,
+                                       bulk: bool = False) -> List[Workspace]:
+    """
+    Create workspaces from all JSON files in the roles directory concurrently.
 
     Args:
         base_endpoint (str): Base API endpoint
         api_key (str, optional): API key for authentication. Defaults to None.
+        concurrency (int, optional): Maximum number of concurrent requests. Defaults to DEFAULT_CONCURRENCY.
+        bulk (bool, optional): Create all workspaces with one bulk-new request; requires a server
+            that provides /v1/workspace/bulk-new. Defaults to False.
 
     Returns:
         List[Workspace]: List of created workspaces
+
+    Raises:
+        ValueError: If concurrency is less than 1
     """
-    manager = WorkspaceManager(base_endpoint=base_endpoint, api_key=api_key)
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
     role_files = get_role_files()
 
     if not role_files:
         print("No role files found in the roles directory.")
         return []
 
+    with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(role_files))) as executor:
+        if bulk:
+            results = await _create_bulk(base_endpoint, api_key, executor, role_files)
+        else:
+            sem = asyncio.Semaphore(concurrency)
+            name_locks = {}
+            async with _workspace_creator(base_endpoint, api_key, executor) as create:
+                results = await asyncio.gather(
+                    *(_create_one(create, sem, name_locks, executor, file_path) for file_path in role_files),
+                    return_exceptions=True
+                )
+
     created_workspaces = []
-    for file_path in role_files:
-        try:
-            print(f"Creating workspace from {os.path.basename(file_path)}...")
-            with open(file_path, 'r') as f:
-                config = json.load(f)
-
-            # Print the request payload for debugging
-            print(f"  Request payload: {config}")
-
-            workspace = manager.create_workspace(config)
-            created_workspaces.append(workspace)
-            print(f"✅ Created workspace: {workspace}")
-        except Exception as e:
-            print(f"❌ Error creating workspace from {file_path}: {str(e)}")
+    for file_path, result in zip(role_files, results):
+        if isinstance(result, BaseException):
+            print(f"❌ Error creating workspace from {file_path}: {str(result)}")
             # Print more detailed error information if available
-            if hasattr(e, 'status_code') and hasattr(e, 'response_text'):
-                print(f"  Status code: {e.status_code}")
-                print(f"  Response: {e.response_text}")
+            if hasattr(result, 'status_code') and hasattr(result, 'response_text'):
+                print(f"  Status code: {result.status_code}")
+                print(f"  Response: {result.response_text}")
+        else:
+            created_workspaces.append(result)
+            print(f"✅ Created workspace: {result}")
 
     return created_workspaces
 
+def create_role_workspaces(base_endpoint: str, api_key: str = None,
+                           concurrency: int = DEFAULT_CONCURRENCY, bulk: bool = False) -> List[Workspace]:
+    """
+    Create workspaces from all JSON files in the roles directory.
+
+    Requests are sent concurrently; use create_role_workspaces_async from inside a running event loop.
+
+    Args:
+        base_endpoint (str): Base API endpoint
+        api_key (str, optional): API key for authentication. Defaults to None.
+        concurrency (int, optional): Maximum number of concurrent requests. Defaults to DEFAULT_CONCURRENCY.
+        bulk (bool, optional): Create all workspaces with one bulk-new request. Defaults to False.
+
+    Returns:
+        List[Workspace]: List of created workspaces
+    """
+    return asyncio.run(create_role_workspaces_async(base_endpoint, api_key, concurrency, bulk))
+
 if __name__ == "__main__":
     import argparse
 
@@ -69,8 +294,14 @@ if __name__ == "__main__":
     parser.add_argument('--endpoint', type=str, default='http://localhost:3001',
                         help='Base API endpoint (default: http://localhost:3001)')
     parser.add_argument('--api-key', type=str, help='API key for authentication')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Maximum number of concurrent requests (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--bulk', action='store_true',
+                        help='Create all workspaces with a single bulk-new request')
 
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
 
-    workspaces = create_role_workspaces(args.endpoint, args.api_key)
+    workspaces = create_role_workspaces(args.endpoint, args.api_key, args.concurrency, args.bulk)
     print(f"\nCreated {len(workspaces)} workspaces from role files.")
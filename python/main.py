@@ -1,14 +1,15 @@
 import json
 import argparse
+import logging
 import sys
 from typing import Dict, List, Any
 
 from workspace import Workspace
-from workspace_manager import WorkspaceManager
-from create_role_workspaces import create_role_workspaces
+from workspace_manager import WorkspaceManager, DEFAULT_CONCURRENCY
 
 
-def create_workspace_from_json(json_data: Dict[str, Any], base_endpoint: str, api_key: str = None) -> Workspace:
+def create_workspace_from_json(json_data: Dict[str, Any], base_endpoint: str, api_key: str = None,
+                               manager: WorkspaceManager = None) -> Workspace:
     """
     Create a workspace from JSON data.
 
@@ -16,15 +17,18 @@ def create_workspace_from_json(json_data: Dict[str, Any], base_endpoint: str, ap
         json_data (Dict[str, Any]): JSON data with workspace settings
         base_endpoint (str): Base API endpoint
         api_key (str, optional): API key for authentication. Defaults to None.
+        manager (WorkspaceManager, optional): Manager to reuse. Defaults to a new one for the endpoint.
 
     Returns:
         Workspace: Created workspace
     """
-    manager = WorkspaceManager(base_endpoint=base_endpoint, api_key=api_key)
+    if manager is None:
+        manager = WorkspaceManager(base_endpoint=base_endpoint, api_key=api_key)
     return manager.create_workspace(json_data)
 
 
-def create_workspaces_from_file(file_path: str, base_endpoint: str, api_key: str = None) -> List[Workspace]:
+def create_workspaces_from_file(file_path: str, base_endpoint: str, api_key: str = None,
+                                manager: WorkspaceManager = None) -> List[Workspace]:
     """
     Create workspaces from a JSON file.
 
@@ -32,35 +36,99 @@ def create_workspaces_from_file(file_path: str, base_endpoint: str, api_key: str
         file_path (str): Path to JSON file
         base_endpoint (str): Base API endpoint
         api_key (str, optional): API key for authentication. Defaults to None.
+        manager (WorkspaceManager, optional): Manager to reuse. Defaults to a new one for the endpoint.
 
     Returns:
         List[Workspace]: List of created workspaces
     """
-    manager = WorkspaceManager(base_endpoint=base_endpoint, api_key=api_key)
+    if manager is None:
+        manager = WorkspaceManager(base_endpoint=base_endpoint, api_key=api_key)
     return manager.create_workspaces_from_json_file(file_path)
 
 
-def list_workspaces(base_endpoint: str, api_key: str = None) -> List[Dict[str, Any]]:
+def list_workspaces(base_endpoint: str, api_key: str = None,
+                    manager: WorkspaceManager = None) -> List[Dict[str, Any]]:
     """
     List all workspaces.
 
     Args:
         base_endpoint (str): Base API endpoint
         api_key (str, optional): API key for authentication. Defaults to None.
+        manager (WorkspaceManager, optional): Manager to reuse. Defaults to a new one for the endpoint.
 
     Returns:
         List[Dict[str, Any]]: List of workspace details
     """
-    manager = WorkspaceManager(base_endpoint=base_endpoint, api_key=api_key)
+    if manager is None:
+        manager = WorkspaceManager(base_endpoint=base_endpoint, api_key=api_key)
     return manager.list_workspaces()
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _manager(args: argparse.Namespace) -> WorkspaceManager:
+    """Build a WorkspaceManager for the endpoint and API key given on the command line."""
+    return WorkspaceManager(base_endpoint=args.endpoint, api_key=args.api_key)
+
+
+def _cmd_create(args: argparse.Namespace) -> None:
+    """Create a workspace from a JSON string."""
+    json_data = json.loads(args.json)
+    with _manager(args) as manager:
+        workspace = create_workspace_from_json(json_data, args.endpoint, args.api_key, manager)
+    print(f"Workspace created: {workspace}")
+    print(json.dumps(workspace.to_json(), indent=2))
+
+
+def _cmd_create_from_file(args: argparse.Namespace) -> None:
+    """Create workspaces from a JSON file."""
+    with _manager(args) as manager:
+        workspaces = create_workspaces_from_file(args.file, args.endpoint, args.api_key, manager)
+    print(f"Created {len(workspaces)} workspaces:")
+    for workspace in workspaces:
+        print(f"- {workspace}")
+
+
+def _cmd_list(args: argparse.Namespace) -> None:
+    """List all workspaces."""
+    with _manager(args) as manager:
+        workspaces = list_workspaces(args.endpoint, args.api_key, manager)
+    print(f"Found {len(workspaces)} workspaces:")
+    for workspace in workspaces:
+        print(f"- {workspace['name']} (slug: {workspace['slug']})")
+
+
+def _cmd_create_from_roles(args: argparse.Namespace) -> None:
+    """Create workspaces from all JSON files in the roles directory."""
+    # Imported here so other commands don't pay for loading the async HTTP stack
+    from create_role_workspaces import create_role_workspaces
+
+    workspaces = create_role_workspaces(args.endpoint, args.api_key, args.concurrency, args.bulk)
+    print(f"\nCreated {len(workspaces)} workspaces from role files.")
+
+
+# Command name -> handler(args)
+HANDLERS = {
+    'create': _cmd_create,
+    'create-from-file': _cmd_create_from_file,
+    'list': _cmd_list,
+    'create-from-roles': _cmd_create_from_roles,
+}
+
+
 def main():
     """Main function to parse arguments and execute commands."""
     parser = argparse.ArgumentParser(description='AnythingLLM Workspace Manager')
     parser.add_argument('--endpoint', type=str, default='http://localhost:3001',
                         help='Base API endpoint (default: http://localhost:3001)')
     parser.add_argument('--api-key', type=str, help='API key for authentication')
+    parser.add_argument('--debug', action='store_true', help='Log API requests and responses')
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
@@ -76,40 +144,25 @@ def main():
     subparsers.add_parser('list', help='List all workspaces')
 
     # Create workspaces from roles directory
-    subparsers.add_parser('create-from-roles', help='Create workspaces from all JSON files in the roles directory')
+    roles_parser = subparsers.add_parser('create-from-roles',
+                                         help='Create workspaces from all JSON files in the roles directory')
+    roles_parser.add_argument('--concurrency', type=_positive_int, default=DEFAULT_CONCURRENCY,
+                              help=f'Maximum number of concurrent requests (default: {DEFAULT_CONCURRENCY})')
+    roles_parser.add_argument('--bulk', action='store_true',
+                              help='Create all workspaces with a single bulk-new request')
 
     args = parser.parse_args()
 
-    if not args.command:
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING,
+                        format='%(levelname)s %(name)s: %(message)s')
+
+    handler = HANDLERS.get(args.command)
+    if not handler:
         parser.print_help()
         return
 
     try:
-        match args.command:
-            case 'create':
-                json_data = json.loads(args.json)
-                workspace = create_workspace_from_json(json_data, args.endpoint, args.api_key)
-                print(f"Workspace created: {workspace}")
-                print(json.dumps(workspace.to_json(), indent=2))
-
-            case 'create-from-file':
-                workspaces = create_workspaces_from_file(args.file, args.endpoint, args.api_key)
-                print(f"Created {len(workspaces)} workspaces:")
-                for workspace in workspaces:
-                    print(f"- {workspace}")
-
-            case 'list':
-                workspaces = list_workspaces(args.endpoint, args.api_key)
-                print(f"Found {len(workspaces)} workspaces:")
-                for workspace in workspaces:
-                    print(f"- {workspace['name']} (slug: {workspace['slug']})")
-
-            case 'create-from-roles':
-                workspaces = create_role_workspaces(args.endpoint, args.api_key)
-                print(f"\nCreated {len(workspaces)} workspaces from role files.")
-
-            case _:
-                parser.print_help()
+        handler(args)
 
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
@@ -1,3 +1,3 @@
-from .api import APIClient, APIError
+from .api import APIClient, AsyncAPIClient, APIError
 
-__all__ = ['APIClient', 'APIError']
+__all__ = ['APIClient', 'AsyncAPIClient', 'APIError']
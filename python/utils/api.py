@@ -1,5 +1,21 @@
+import logging
+import functools
 import requests
-from typing import Dict, Any, Optional, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Union
+from . import json_utils
+
+# aiohttp is optional and slow to import, so it is only loaded once an AsyncAPIClient is created
+aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Read size for streaming responses; chunked responses still yield each chunk as it arrives
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Longest error body kept on an APIError; servers may answer with large HTML error pages
+MAX_ERROR_TEXT = 2048
 
 
 class APIError(Exception):
@@ -12,6 +28,179 @@ class APIError(Exception):
         super().__init__(self.message)
 
 
+def _error_text(content: Optional[bytes]) -> Optional[str]:
+    """
+    Decode at most MAX_ERROR_TEXT bytes of an error response body.
+
+    Args:
+        content (Optional[bytes]): Raw response body
+
+    Returns:
+        Optional[str]: Decoded, truncated body, or None if there is no body
+    """
+    if content is None:
+        return None
+    return content[:MAX_ERROR_TEXT].decode('utf-8', 'replace')
+
+
+def _err(message: str, e: Exception, streamed: bool = False) -> APIError:
+    """
+    Build an APIError from an HTTP client exception.
+
+    Args:
+        message (str): Error message
+        e (Exception): Exception raised by requests or httpx, optionally carrying a response
+        streamed (bool, optional): Whether the response was requested with stream=True and its body
+            has not been read yet. Only MAX_ERROR_TEXT bytes of it are then read. Defaults to False.
+
+    Returns:
+        APIError: Error with the status code and truncated body of the response, if any
+    """
+    response = getattr(e, 'response', None)
+    if response is None:
+        return APIError(message)
+    if not streamed:
+        return APIError(message, response.status_code, _error_text(response.content))
+
+    try:
+        content = response.raw.read(MAX_ERROR_TEXT, decode_content=True)
+    finally:
+        response.close()
+    return APIError(message, response.status_code, _error_text(content))
+
+
+@functools.lru_cache(maxsize=256)
+def _build_url(base_endpoint: str, endpoint: str) -> str:
+    """
+    Build the full URL for an API endpoint.
+
+    Results are memoized, since clients hit the same handful of endpoints repeatedly.
+
+    Args:
+        base_endpoint (str): Base API endpoint
+        endpoint (str): API endpoint (without base URL)
+
+    Returns:
+        str: Full URL
+    """
+    # Prepend '/api' to the endpoint if it doesn't already start with '/api'
+    if not endpoint.startswith('/api'):
+        endpoint = f"/api/{endpoint.lstrip('/')}"
+
+    return f"{base_endpoint}/{endpoint.lstrip('/')}"
+
+
+def _build_headers(api_key: str = None) -> Dict[str, str]:
+    """
+    Build headers for API requests.
+
+    Args:
+        api_key (str, optional): API key for authentication. Defaults to None.
+
+    Returns:
+        Dict[str, str]: Headers dictionary
+    """
+    headers = {
+        'Content-Type': 'application/json'
+    }
+    if api_key:
+        headers['Authorization'] = f'Bearer {api_key}'
+    return headers
+
+
+def _log_response(response: requests.Response, include_body: bool = True) -> None:
+    """
+    Log a response at DEBUG level.
+
+    Nothing is formatted, copied or sliced unless DEBUG logging is enabled.
+
+    Args:
+        response (requests.Response): Response to log
+        include_body (bool, optional): Whether to log a preview of the body. Must be False for
+            streaming responses, whose body has not been read yet. Defaults to True.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response status code: %s", response.status_code)
+        logger.debug("Response headers: %s", dict(response.headers))
+        if include_body:
+            logger.debug("Response body: %s", response.content[:512])
+
+
+def _parse_stream_line(line: bytes) -> Dict[str, Any]:
+    """
+    Parse a single line of a streaming response.
+
+    Args:
+        line (bytes): Non-empty response line, either an SSE "data: " line or raw JSON
+
+    Returns:
+        Dict[str, Any]: Parsed chunk
+    """
+    if line.startswith(b'data: '):
+        return json_utils.loads(line[6:])
+    try:
+        return json_utils.loads(line)
+    except ValueError:
+        return {"error": "Failed to parse response line"}
+
+
+class _StreamDecoder:
+    """
+    Incrementally split a streaming response body into parsed chunks.
+    Partial lines are buffered until the rest of the line arrives.
+    """
+
+    def __init__(self):
+        self._buffer = b''
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        """
+        Add received bytes and parse every line they complete.
+
+        Args:
+            data (bytes): Bytes received from the stream
+
+        Returns:
+            List[Dict[str, Any]]: Parsed chunks, in order
+        """
+        lines = (self._buffer + data).split(b'\n')
+        self._buffer = lines.pop()
+        parsed = []
+        for line in lines:
+            line = line.rstrip(b'\r')
+            if line:
+                parsed.append(_parse_stream_line(line))
+        return parsed
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Parse whatever is left once the stream has ended without a trailing newline.
+
+        Returns:
+            List[Dict[str, Any]]: Parsed chunks, in order
+        """
+        line = self._buffer.rstrip(b'\r')
+        self._buffer = b''
+        return [_parse_stream_line(line)] if line else []
+
+
+def _create_session() -> requests.Session:
+    """
+    Create a requests session that keeps connections alive between requests.
+
+    Returns:
+        requests.Session: Session with a pooled, retrying adapter mounted
+    """
+    # Retry idempotent requests on transient gateway errors; POSTs are never retried
+    retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class APIClient:
     """
     A client for interacting with the AnythingLLM API.
@@ -27,20 +216,18 @@ class APIClient:
         """
         self.base_endpoint = base_endpoint.rstrip('/')
         self.api_key = api_key
+        self._headers = _build_headers(api_key)
+        self._session = _create_session()
 
-    def _get_headers(self) -> Dict[str, str]:
-        """
-        Get headers for API requests.
+    def __enter__(self) -> 'APIClient':
+        return self
 
-        Returns:
-            Dict[str, str]: Headers dictionary
-        """
-        headers = {
-            'Content-Type': 'application/json'
-        }
-        if self.api_key:
-            headers['Authorization'] = f'Bearer {self.api_key}'
-        return headers
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
     def get(self, endpoint: str, params: Dict = None) -> Dict[str, Any]:
         """
@@ -56,43 +243,33 @@ class APIClient:
         Raises:
             APIError: If the request fails
         """
-        # Prepend '/api' to the endpoint if it doesn't already start with '/api'
-        if not endpoint.startswith('/api'):
-            endpoint = f"/api/{endpoint.lstrip('/')}"
-
-        url = f"{self.base_endpoint}/{endpoint.lstrip('/')}"
+        url = _build_url(self.base_endpoint, endpoint)
 
         try:
-            print(f"Making GET request to: {url}")
-            print(f"Headers: {self._get_headers()}")
-            print(f"Params: {params}")
+            logger.debug("Making GET request to: %s", url)
+            logger.debug("Params: %s", params)
 
-            response = requests.get(url, headers=self._get_headers(), params=params)
-            print(f"Response status code: {response.status_code}")
-            print(f"Response headers: {response.headers}")
-            print(f"Response text: {response.text[:500]}...")
+            response = self._session.get(url, headers=self._headers, params=params)
+            _log_response(response)
 
             response.raise_for_status()
 
             # Handle empty responses
-            if not response.text.strip():
-                print("Warning: Empty response received")
+            if not response.content.strip():
+                logger.warning("Empty response received from %s", url)
                 return {}
 
             try:
-                return response.json()
+                return json_utils.loads(response.content)
             except ValueError as json_err:
-                print(f"JSON parsing error: {str(json_err)}")
-                print(f"Raw response: {response.text}")
-                raise APIError(f"Failed to parse JSON response: {str(json_err)}", response.status_code, response.text)
+                logger.debug("JSON parsing error: %s", json_err)
+                raise APIError(f"Failed to parse JSON response: {str(json_err)}", response.status_code,
+                               _error_text(response.content)) from json_err
 
         except requests.exceptions.RequestException as e:
-            status_code = getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
-            response_text = getattr(e.response, 'text', None) if hasattr(e, 'response') else None
-            print(f"Request exception: {str(e)}")
-            print(f"Status code: {status_code}")
-            print(f"Response text: {response_text}")
-            raise APIError(f"GET request failed: {str(e)}", status_code, response_text)
+            error = _err(f"GET request failed: {str(e)}", e)
+            logger.debug("Request exception: %s (status code: %s)", e, error.status_code)
+            raise error from e
 
     def post(self, endpoint: str, data: Dict = None) -> Dict[str, Any]:
         """
@@ -108,43 +285,34 @@ class APIClient:
         Raises:
             APIError: If the request fails
         """
-        # Prepend '/api' to the endpoint if it doesn't already start with '/api'
-        if not endpoint.startswith('/api'):
-            endpoint = f"/api/{endpoint.lstrip('/')}"
-
-        url = f"{self.base_endpoint}/{endpoint.lstrip('/')}"
+        url = _build_url(self.base_endpoint, endpoint)
 
         try:
-            print(f"Making POST request to: {url}")
-            print(f"Headers: {self._get_headers()}")
-            print(f"Data: {data}")
+            logger.debug("Making POST request to: %s", url)
+            logger.debug("Data: %s", data)
 
-            response = requests.post(url, headers=self._get_headers(), json=data)
-            print(f"Response status code: {response.status_code}")
-            print(f"Response headers: {response.headers}")
-            print(f"Response text: {response.text[:500]}...")
+            body = json_utils.dumps(data) if data is not None else None
+            response = self._session.post(url, headers=self._headers, data=body)
+            _log_response(response)
 
             response.raise_for_status()
 
             # Handle empty responses
-            if not response.text.strip():
-                print("Warning: Empty response received")
+            if not response.content.strip():
+                logger.warning("Empty response received from %s", url)
                 return {}
 
             try:
-                return response.json()
+                return json_utils.loads(response.content)
             except ValueError as json_err:
-                print(f"JSON parsing error: {str(json_err)}")
-                print(f"Raw response: {response.text}")
-                raise APIError(f"Failed to parse JSON response: {str(json_err)}", response.status_code, response.text)
+                logger.debug("JSON parsing error: %s", json_err)
+                raise APIError(f"Failed to parse JSON response: {str(json_err)}", response.status_code,
+                               _error_text(response.content)) from json_err
 
         except requests.exceptions.RequestException as e:
-            status_code = getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
-            response_text = getattr(e.response, 'text', None) if hasattr(e, 'response') else None
-            print(f"Request exception: {str(e)}")
-            print(f"Status code: {status_code}")
-            print(f"Response text: {response_text}")
-            raise APIError(f"POST request failed: {str(e)}", status_code, response_text)
+            error = _err(f"POST request failed: {str(e)}", e)
+            logger.debug("Request exception: %s (status code: %s)", e, error.status_code)
+            raise error from e
 
     def delete(self, endpoint: str) -> Union[Dict[str, Any], bool]:
         """
@@ -159,25 +327,22 @@ class APIClient:
         Raises:
             APIError: If the request fails
         """
-        # Prepend '/api' to the endpoint if it doesn't already start with '/api'
-        if not endpoint.startswith('/api'):
-            endpoint = f"/api/{endpoint.lstrip('/')}"
-
-        url = f"{self.base_endpoint}/{endpoint.lstrip('/')}"
+        url = _build_url(self.base_endpoint, endpoint)
 
         try:
-            response = requests.delete(url, headers=self._get_headers())
+            logger.debug("Making DELETE request to: %s", url)
+
+            response = self._session.delete(url, headers=self._headers)
+            _log_response(response)
             response.raise_for_status()
 
             # Some DELETE endpoints return no content
-            if response.status_code == 204 or not response.text:
+            if response.status_code == 204 or not response.content:
                 return True
 
-            return response.json()
+            return json_utils.loads(response.content)
         except requests.exceptions.RequestException as e:
-            status_code = getattr(e.response, 'status_code', None)
-            response_text = getattr(e.response, 'text', None)
-            raise APIError(f"DELETE request failed: {str(e)}", status_code, response_text)
+            raise _err(f"DELETE request failed: {str(e)}", e) from e
 
     def stream_post(self, endpoint: str, data: Dict = None):
         """
@@ -193,29 +358,154 @@ class APIClient:
         Raises:
             APIError: If the request fails
         """
-        import json
-
-        # Prepend '/api' to the endpoint if it doesn't already start with '/api'
-        if not endpoint.startswith('/api'):
-            endpoint = f"/api/{endpoint.lstrip('/')}"
-
-        url = f"{self.base_endpoint}/{endpoint.lstrip('/')}"
+        url = _build_url(self.base_endpoint, endpoint)
 
         try:
-            response = requests.post(url, headers=self._get_headers(), json=data, stream=True)
+            body = json_utils.dumps(data) if data is not None else None
+            logger.debug("Making streaming POST request to: %s", url)
+            logger.debug("Data: %s", data)
+
+            response = self._session.post(url, headers=self._headers, data=body, stream=True)
+            _log_response(response, include_body=False)
             response.raise_for_status()
 
-            for line in response.iter_lines():
-                if line:
-                    if line.startswith(b'data: '):
-                        data = json.loads(line[6:])
-                        yield data
-                    else:
-                        try:
-                            yield json.loads(line)
-                        except:
-                            yield {"error": "Failed to parse response line"}
+            decoder = _StreamDecoder()
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                yield from decoder.feed(chunk)
+            yield from decoder.flush()
         except requests.exceptions.RequestException as e:
-            status_code = getattr(e.response, 'status_code', None)
-            response_text = getattr(e.response, 'text', None)
-            raise APIError(f"Streaming POST request failed: {str(e)}", status_code, response_text)
+            raise _err(f"Streaming POST request failed: {str(e)}", e, streamed=True) from e
+
+
+def _load_aiohttp() -> None:
+    """
+    Import aiohttp on first use.
+
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("aiohttp is required for AsyncAPIClient. Install it with: pip install aiohttp") from None
+
+
+class AsyncAPIClient:
+    """
+    An asyncio client for interacting with the AnythingLLM API.
+    Requires the optional aiohttp dependency.
+    """
+
+    def __init__(self, base_endpoint: str = "http://localhost:3001", api_key: str = None):
+        """
+        Initialize an AsyncAPIClient object.
+
+        Args:
+            base_endpoint (str, optional): Base API endpoint. Defaults to "http://localhost:3001".
+            api_key (str, optional): API key for authentication. Defaults to None.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        _load_aiohttp()
+
+        self.base_endpoint = base_endpoint.rstrip('/')
+        self.api_key = api_key
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncAPIClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """
+        Get the shared aiohttp session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: Client session
+        """
+        if self._session is None:
+            # No total timeout, matching APIClient; chat streams can stay open for a long time
+            self._session = aiohttp.ClientSession(
+                headers=_build_headers(self.api_key),
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=30)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def post(self, endpoint: str, data: Dict = None) -> Dict[str, Any]:
+        """
+        Make a POST request to the API.
+
+        Args:
+            endpoint (str): API endpoint (without base URL)
+            data (Dict, optional): Request body. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: Response data
+
+        Raises:
+            APIError: If the request fails
+        """
+        url = _build_url(self.base_endpoint, endpoint)
+        body = json_utils.dumps(data) if data is not None else None
+
+        try:
+            async with self._get_session().post(url, data=body) as response:
+                content = await response.read()
+                if response.status >= 400:
+                    raise APIError(f"POST request failed: {response.status} {response.reason}",
+                                   response.status, _error_text(content))
+        except aiohttp.ClientError as e:
+            raise APIError(f"POST request failed: {str(e)}") from e
+
+        # Handle empty responses
+        if not content.strip():
+            return {}
+
+        try:
+            return json_utils.loads(content)
+        except ValueError as json_err:
+            raise APIError(f"Failed to parse JSON response: {str(json_err)}", response.status,
+                           _error_text(content)) from json_err
+
+    async def stream_post(self, endpoint: str, data: Dict = None):
+        """
+        Make a streaming POST request to the API.
+
+        Args:
+            endpoint (str): API endpoint (without base URL)
+            data (Dict, optional): Request body. Defaults to None.
+
+        Yields:
+            Dict[str, Any]: Streaming response chunks
+
+        Raises:
+            APIError: If the request fails
+        """
+        url = _build_url(self.base_endpoint, endpoint)
+        body = json_utils.dumps(data) if data is not None else None
+
+        try:
+            async with self._get_session().post(url, data=body) as response:
+                if response.status >= 400:
+                    raise APIError(f"Streaming POST request failed: {response.status} {response.reason}",
+                                   response.status, _error_text(await response.content.read(MAX_ERROR_TEXT)))
+
+                decoder = _StreamDecoder()
+                async for chunk in response.content.iter_any():
+                    for parsed in decoder.feed(chunk):
+                        yield parsed
+                for parsed in decoder.flush():
+                    yield parsed
+        except aiohttp.ClientError as e:
+            raise APIError(f"Streaming POST request failed: {str(e)}") from e
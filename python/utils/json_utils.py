@@ -0,0 +1,86 @@
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the standard library
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data (Union[bytes, str]): JSON document
+
+    Returns:
+        Any: Parsed value
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize a value to a UTF-8 encoded JSON document.
+
+    Args:
+        obj (Any): JSON-serializable value
+        pretty (bool, optional): Indent nested values by two spaces. Defaults to False.
+
+    Returns:
+        bytes: JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def read_file(file_path: str) -> bytes:
+    """
+    Read a whole file with os.read calls sized from fstat, bypassing Python's buffered file objects.
+
+    Args:
+        file_path (str): Path to the file
+
+    Returns:
+        bytes: File contents
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        # A single read normally returns everything; keep reading in case it comes up short
+        # or the file grew since fstat
+        while True:
+            chunk = os.read(fd, max(size, 1))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+
+
+def load_file(file_path: str) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Args:
+        file_path (str): Path to the JSON file
+
+    Returns:
+        Any: Parsed value
+
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    return loads(read_file(file_path))
@@ -1,7 +1,62 @@
 import uuid
-import json
+import contextlib
 from typing import Dict, List, Optional, Union, Any
-from utils.api import APIClient, APIError
+from utils import json_utils
+from utils.api import APIClient, AsyncAPIClient, APIError
+
+# JSON Schema for a workspace configuration, as accepted by Workspace.from_json
+WORKSPACE_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["workspace_name", "custom_prompt"],
+    "properties": {
+        "workspace_name": {"type": "string", "minLength": 1},
+        "custom_prompt": {"type": "string", "minLength": 1},
+        "temperature": {"type": "number", "minimum": 0},
+        "similarity_threshold": {"type": "number", "minimum": 0, "maximum": 1},
+        "history_count": {"type": "integer", "minimum": 0},
+        "query_refusal_response": {"type": "string"},
+        "chat_mode": {"enum": ["chat", "query"]},
+        "top_n": {"type": "integer", "minimum": 1}
+    }
+}
+# Defaults for the optional settings of a workspace configuration
+WORKSPACE_DEFAULTS = {
+    "temperature": 0.7,
+    "similarity_threshold": 0.7,
+    "history_count": 20,
+    "query_refusal_response": "I'm sorry, I cannot answer that question based on the available information.",
+    "chat_mode": "chat",
+    "top_n": 4
+}
+
+# Workspace configuration keys, which are also the Workspace constructor arguments
+_CONFIG_FIELDS = ("workspace_name", "custom_prompt", *WORKSPACE_DEFAULTS)
+
+# Defaults for fields missing from an API workspace record
+_API_DEFAULTS = {
+    "name": "",
+    "openAiPrompt": "",
+    "openAiTemp": 0.7,
+    "similarityThreshold": 0.7,
+    "openAiHistory": 20,
+    "queryRefusalResponse": "",
+    "chatMode": "chat",
+    "topN": 4,
+    "id": None,
+    "slug": None
+}
+
+# (constructor argument, API field) for building a Workspace from an API workspace record
+_API_FIELD_MAP = (
+    ("workspace_name", "name"),
+    ("custom_prompt", "openAiPrompt"),
+    ("temperature", "openAiTemp"),
+    ("similarity_threshold", "similarityThreshold"),
+    ("history_count", "openAiHistory"),
+    ("query_refusal_response", "queryRefusalResponse"),
+    ("chat_mode", "chatMode"),
+    ("top_n", "topN")
+)
 
 
 class Workspace:
@@ -10,6 +65,17 @@ class Workspace:
     This class provides methods to create, update, and interact with workspaces.
     """
 
+    # Fixed attribute layout without a per-instance __dict__, so instances are smaller. Attributes
+    # not listed here can't be set on a Workspace
+    __slots__ = (
+        *_CONFIG_FIELDS,
+        "base_endpoint",
+        "api_key",
+        "workspace_id",
+        "workspace_slug",
+        "_api_client"
+    )
+
     def __init__(
         self,
         workspace_name: str,
@@ -21,7 +87,10 @@ class Workspace:
         chat_mode: str = "chat",
         top_n: int = 4,
         base_endpoint: str = "http://localhost:3001",
-        api_key: str = None
+        api_key: str = None,
+        api_client: APIClient = None,
+        workspace_id: int = None,
+        workspace_slug: str = None
     ):
         """
         Initialize a Workspace object with the given parameters.
@@ -37,6 +106,10 @@ class Workspace:
             top_n (int, optional): Number of top results to return in vector search. Defaults to 4.
             base_endpoint (str, optional): Base API endpoint. Defaults to "http://localhost:3001".
             api_key (str, optional): API key for authentication. Defaults to None.
+            api_client (APIClient, optional): Client to share with other workspaces, such as the one
+                owned by a WorkspaceManager. Defaults to a client created on first use.
+            workspace_id (int, optional): ID of an existing workspace. Defaults to None.
+            workspace_slug (str, optional): Slug of an existing workspace. Defaults to None.
         """
         self.workspace_name = workspace_name
         self.custom_prompt = custom_prompt
@@ -48,31 +121,29 @@ class Workspace:
         self.top_n = top_n
         self.base_endpoint = base_endpoint.rstrip('/')
         self.api_key = api_key
-        self.workspace_id = None
-        self.workspace_slug = None
+        self.workspace_id = workspace_id
+        self.workspace_slug = workspace_slug
+        self._api_client = api_client
 
     def _get_api_client(self) -> APIClient:
         """
-        Get an API client instance.
+        Get the API client instance, creating it on first use.
 
         Returns:
-            APIClient: API client instance
+            APIClient: API client instance shared by all operations on this workspace
         """
-        return APIClient(base_endpoint=self.base_endpoint, api_key=self.api_key)
+        if self._api_client is None:
+            self._api_client = APIClient(base_endpoint=self.base_endpoint, api_key=self.api_key)
+        return self._api_client
 
-    def create(self) -> Dict[str, Any]:
+    def _payload(self) -> Dict[str, Any]:
         """
-        Create a new workspace with the configured settings.
+        Build the API payload for creating or updating the workspace.
 
         Returns:
-            Dict[str, Any]: Response from the API containing workspace details
-
-        Raises:
-            APIError: If the API request fails
+            Dict[str, Any]: Workspace settings in the API's field names
         """
-        endpoint = "v1/workspace/new"
-
-        payload = {
+        return {
             "name": self.workspace_name,
             "similarityThreshold": self.similarity_threshold,
             "openAiTemp": self.temperature,
@@ -83,13 +154,58 @@ class Workspace:
             "topN": self.top_n
         }
 
-        api_client = self._get_api_client()
-        data = api_client.post(endpoint, payload)
+    def _chat_payload(self, message: str, session_id: str = None, attachments: List = None) -> Dict[str, Any]:
+        """
+        Build the API payload for a chat message.
+
+        Args:
+            message (str): Message to send
+            session_id (str, optional): Session ID for chat continuity. Defaults to None.
+            attachments (List, optional): List of attachments. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: Chat request payload
+        """
+        payload = {
+            "message": message,
+            "mode": self.chat_mode
+        }
+
+        if session_id:
+            payload["sessionId"] = session_id
+
+        if attachments:
+            payload["attachments"] = attachments
+
+        return payload
+
+    def _update_from_response(self, data: Dict[str, Any]) -> None:
+        """
+        Set the workspace ID and slug from a create response.
 
+        Args:
+            data (Dict[str, Any]): Response from the workspace creation API
+        """
         if 'workspace' in data:
             self.workspace_id = data['workspace'].get('id')
             self.workspace_slug = data['workspace'].get('slug')
 
+    def create(self) -> Dict[str, Any]:
+        """
+        Create a new workspace with the configured settings.
+
+        Returns:
+            Dict[str, Any]: Response from the API containing workspace details
+
+        Raises:
+            APIError: If the API request fails
+        """
+        endpoint = "v1/workspace/new"
+
+        api_client = self._get_api_client()
+        data = api_client.post(endpoint, self._payload())
+        self._update_from_response(data)
+
         return data
 
     def update(self) -> Dict[str, Any]:
@@ -108,19 +224,8 @@ class Workspace:
 
         endpoint = f"v1/workspace/{self.workspace_slug}/update"
 
-        payload = {
-            "name": self.workspace_name,
-            "similarityThreshold": self.similarity_threshold,
-            "openAiTemp": self.temperature,
-            "openAiHistory": self.history_count,
-            "openAiPrompt": self.custom_prompt,
-            "queryRefusalResponse": self.query_refusal_response,
-            "chatMode": self.chat_mode,
-            "topN": self.top_n
-        }
-
         api_client = self._get_api_client()
-        return api_client.post(endpoint, payload)
+        return api_client.post(endpoint, self._payload())
 
     def delete(self) -> bool:
         """
@@ -187,16 +292,7 @@ class Workspace:
 
         endpoint = f"v1/workspace/{self.workspace_slug}/chat"
 
-        payload = {
-            "message": message,
-            "mode": self.chat_mode
-        }
-
-        if session_id:
-            payload["sessionId"] = session_id
-
-        if attachments:
-            payload["attachments"] = attachments
+        payload = self._chat_payload(message, session_id, attachments)
 
         api_client = self._get_api_client()
         return api_client.post(endpoint, payload)
@@ -222,20 +318,46 @@ class Workspace:
 
         endpoint = f"v1/workspace/{self.workspace_slug}/stream-chat"
 
-        payload = {
-            "message": message,
-            "mode": self.chat_mode
-        }
-
-        if session_id:
-            payload["sessionId"] = session_id
-
-        if attachments:
-            payload["attachments"] = attachments
+        payload = self._chat_payload(message, session_id, attachments)
 
         api_client = self._get_api_client()
         yield from api_client.stream_post(endpoint, payload)
 
+    async def astream_chat(self, message: str, session_id: str = None, attachments: List = None,
+                           api_client: AsyncAPIClient = None):
+        """
+        Stream a chat message to the workspace without blocking the event loop.
+
+        Args:
+            message (str): Message to send
+            session_id (str, optional): Session ID for chat continuity. Defaults to None.
+            attachments (List, optional): List of attachments. Defaults to None.
+            api_client (AsyncAPIClient, optional): Client to stream through, e.g. one shared by
+                several concurrent streams. Defaults to a client scoped to this call.
+
+        Yields:
+            Dict[str, Any]: Streaming response chunks
+
+        Raises:
+            ValueError: If workspace slug is not set
+            APIError: If the API request fails
+        """
+        if not self.workspace_slug:
+            raise ValueError("Workspace slug is not set. Cannot stream chat message.")
+
+        endpoint = f"v1/workspace/{self.workspace_slug}/stream-chat"
+
+        payload = self._chat_payload(message, session_id, attachments)
+
+        if api_client is None:
+            client_context = AsyncAPIClient(base_endpoint=self.base_endpoint, api_key=self.api_key)
+        else:
+            client_context = contextlib.nullcontext(api_client)
+
+        async with client_context as client:
+            async for chunk in client.stream_post(endpoint, payload):
+                yield chunk
+
     def vector_search(self, query: str, top_n: int = None, score_threshold: float = None) -> Dict[str, Any]:
         """
         Perform a vector search in the workspace.
@@ -271,50 +393,63 @@ class Workspace:
         return api_client.post(endpoint, payload)
 
     @classmethod
-    def from_json(cls, json_data: Union[str, Dict], base_endpoint: str = "http://localhost:3001", api_key: str = None):
+    def from_json(cls, json_data: Union[str, bytes, Dict], base_endpoint: str = "http://localhost:3001", api_key: str = None,
+                  api_client: APIClient = None):
         """
         Create a Workspace object from JSON data.
 
         Args:
-            json_data (Union[str, Dict]): JSON string or dictionary with workspace settings
+            json_data (Union[str, bytes, Dict]): JSON document or dictionary with workspace settings
             base_endpoint (str, optional): Base API endpoint. Defaults to "http://localhost:3001".
             api_key (str, optional): API key for authentication. Defaults to None.
+            api_client (APIClient, optional): Client to share with other workspaces. Defaults to None.
 
         Returns:
             Workspace: A new Workspace object
         """
-        if isinstance(json_data, str):
-            data = json.loads(json_data)
+        if isinstance(json_data, (str, bytes)):
+            data = json_utils.loads(json_data)
         else:
             data = json_data
 
         # Required parameters
-        workspace_name = data.get("workspace_name")
-        custom_prompt = data.get("custom_prompt")
-
-        if not workspace_name or not custom_prompt:
+        if not data.get("workspace_name") or not data.get("custom_prompt"):
             raise ValueError("workspace_name and custom_prompt are required")
 
-        # Optional parameters with defaults
-        temperature = data.get("temperature", 0.7)
-        similarity_threshold = data.get("similarity_threshold", 0.7)
-        history_count = data.get("history_count", 20)
-        query_refusal_response = data.get("query_refusal_response",
-                                         "I'm sorry, I cannot answer that question based on the available information.")
-        chat_mode = data.get("chat_mode", "chat")
-        top_n = data.get("top_n", 4)
+        # Optional parameters fall back to the defaults
+        settings = {**WORKSPACE_DEFAULTS, **data}
+
+        return cls(
+            **{field: settings[field] for field in _CONFIG_FIELDS},
+            base_endpoint=base_endpoint,
+            api_key=api_key,
+            api_client=api_client
+        )
+
+    @classmethod
+    def from_api_dict(cls, data: Dict[str, Any], base_endpoint: str = "http://localhost:3001", api_key: str = None,
+                      api_client: APIClient = None):
+        """
+        Create a Workspace object for an existing workspace from its API record.
+
+        Args:
+            data (Dict[str, Any]): Workspace record as returned by the workspaces API
+            base_endpoint (str, optional): Base API endpoint. Defaults to "http://localhost:3001".
+            api_key (str, optional): API key for authentication. Defaults to None.
+            api_client (APIClient, optional): Client to share with other workspaces. Defaults to None.
 
+        Returns:
+            Workspace: A new Workspace object with its ID and slug set
+        """
+        # One merge fills every missing field, leaving plain subscripts below
+        settings = {**_API_DEFAULTS, **data}
         return cls(
-            workspace_name=workspace_name,
-            custom_prompt=custom_prompt,
-            temperature=temperature,
-            similarity_threshold=similarity_threshold,
-            history_count=history_count,
-            query_refusal_response=query_refusal_response,
-            chat_mode=chat_mode,
-            top_n=top_n,
+            **{field: settings[api_field] for field, api_field in _API_FIELD_MAP},
             base_endpoint=base_endpoint,
-            api_key=api_key
+            api_key=api_key,
+            api_client=api_client,
+            workspace_id=settings['id'],
+            workspace_slug=settings['slug']
         )
 
     def to_json(self) -> Dict[str, Any]:
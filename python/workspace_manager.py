@@ -1,9 +1,24 @@
-import json
 import os
-from typing import Dict, List, Optional, Union, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Union, Any
 from workspace import Workspace
+from utils import json_utils
 from utils.api import APIClient, APIError
 
+# Upper bound on threads used to send workspace create/delete requests concurrently
+MAX_REQUEST_WORKERS = 32
+
+# Upper bound on threads used to read configuration files concurrently
+MAX_READ_WORKERS = 16
+
+# Default maximum number of workspace creation requests create-from-roles keeps in flight at once.
+# Defined here rather than in create_role_workspaces so the CLI can show it without loading the async stack
+DEFAULT_CONCURRENCY = 8
+
+# Seconds a list_workspaces result is reused before the API is queried again
+LIST_CACHE_TTL = 5.0
+
 
 class WorkspaceManager:
     """
@@ -22,6 +37,21 @@ class WorkspaceManager:
         self.base_endpoint = base_endpoint.rstrip('/')
         self.api_key = api_key
         self.workspaces = {}
+        # One pooled session for the manager and every workspace it creates or loads
+        self._api_client = APIClient(base_endpoint=self.base_endpoint, api_key=self.api_key)
+        self._list_cache = None
+        self._list_cache_ts = 0.0
+        self._list_ttl = LIST_CACHE_TTL
+
+    def __enter__(self) -> 'WorkspaceManager':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the shared API client and its pooled connections."""
+        self._api_client.close()
 
     def create_workspace(self, config: Union[str, Dict]) -> Workspace:
         """
@@ -33,14 +63,63 @@ class WorkspaceManager:
         Returns:
             Workspace: The created workspace object
         """
-        workspace = Workspace.from_json(config, self.base_endpoint, self.api_key)
+        workspace = Workspace.from_json(config, self.base_endpoint, self.api_key, self._api_client)
         response = workspace.create()
+        self.invalidate_list_cache()
 
         # Store the workspace in the manager
         self.workspaces[workspace.workspace_slug] = workspace
 
         return workspace
 
+    def _build_workspaces(self, configs: Iterable[Union[str, Dict]]) -> List[Workspace]:
+        """
+        Build Workspace objects sharing this manager's client, without creating them on the server.
+
+        Args:
+            configs (Iterable[Union[str, Dict]]): JSON strings or dictionaries with workspace settings
+
+        Returns:
+            List[Workspace]: List of workspace objects, in the same order as configs
+        """
+        # Bound locally so the comprehension doesn't repeat attribute lookups per configuration
+        from_json = Workspace.from_json
+        base_endpoint, api_key, api_client = self.base_endpoint, self.api_key, self._api_client
+        return [from_json(config, base_endpoint, api_key, api_client) for config in configs]
+
+    def create_workspaces_bulk(self, configs: List[Union[str, Dict]]) -> List[Workspace]:
+        """
+        Create multiple workspaces with a single request to the bulk-new endpoint.
+
+        The endpoint is all-or-nothing: if any workspace fails, none are created.
+
+        Args:
+            configs (List[Union[str, Dict]]): JSON strings or dictionaries with workspace settings
+
+        Returns:
+            List[Workspace]: List of created workspace objects, in the same order as configs
+
+        Raises:
+            APIError: If the API request fails
+        """
+        workspaces = self._build_workspaces(configs)
+        if not workspaces:
+            return []
+
+        data = self._api_client.post("v1/workspace/bulk-new", {"workspaces": [w._payload() for w in workspaces]})
+        self.invalidate_list_cache()
+
+        created = data.get('workspaces', [])
+        if len(created) != len(workspaces):
+            raise APIError(f"Bulk create returned {len(created)} workspaces for {len(workspaces)} configurations: "
+                           f"{data.get('message')}")
+
+        for workspace, workspace_data in zip(workspaces, created):
+            workspace._update_from_response({'workspace': workspace_data})
+        self.workspaces.update({workspace.workspace_slug: workspace for workspace in workspaces})
+
+        return workspaces
+
     def create_workspaces_from_json_file(self, file_path: str) -> List[Workspace]:
         """
         Create multiple workspaces from a JSON file.
@@ -49,18 +128,93 @@ class WorkspaceManager:
             file_path (str): Path to the JSON file containing workspace configurations
 
         Returns:
-            List[Workspace]: List of created workspace objects
+            List[Workspace]: List of created workspace objects, in file order
+
+        Raises:
+            APIError: If any workspace creation fails, after the others have completed
         """
-        with open(file_path, 'r') as f:
-            configs = json.load(f)
+        configs = json_utils.load_file(file_path)
 
-        if not isinstance(configs, list):
-            configs = [configs]
+        # A file holds a list of configurations or a single one
+        return self.create_workspaces_from_iterable(configs if type(configs) is list else [configs])
 
-        created_workspaces = []
-        for config in configs:
-            workspace = self.create_workspace(config)
-            created_workspaces.append(workspace)
+    def create_workspaces_from_json_files(self, file_paths: List[str]) -> List[Workspace]:
+        """
+        Create workspaces from several JSON files, reading the files concurrently.
+
+        Args:
+            file_paths (List[str]): Paths to JSON files, each holding one configuration or a list of them
+
+        Returns:
+            List[Workspace]: List of created workspace objects, in file order
+
+        Raises:
+            APIError: If any workspace creation fails, after the others have completed
+        """
+        if not file_paths:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(file_paths))) as executor:
+            documents = list(executor.map(json_utils.load_file, file_paths))
+
+        configs = []
+        for document in documents:
+            if type(document) is list:
+                configs.extend(document)
+            else:
+                configs.append(document)
+
+        return self.create_workspaces_from_iterable(configs)
+
+    def create_workspaces_from_iterable(self, configs: Iterable[Union[str, Dict]]) -> List[Workspace]:
+        """
+        Create workspaces from configurations, overlapping the requests on a thread pool.
+
+        Configurations sharing a workspace name are created one after another, in order, so the
+        server can give each a unique slug; only workspaces with different names are created concurrently.
+
+        Args:
+            configs (Iterable[Union[str, Dict]]): JSON strings or dictionaries with workspace settings
+
+        Returns:
+            List[Workspace]: List of created workspace objects, in the same order as configs
+
+        Raises:
+            APIError: If any workspace creation fails, after the others have completed
+        """
+        # Build every workspace up front so invalid configurations fail before any request is sent
+        workspaces = self._build_workspaces(configs)
+        if not workspaces:
+            return []
+
+        # The server picks a slug by checking for an existing one and then inserting, so two concurrent
+        # creates with the same name would race for the same slug. Slugs are lower-case, so group by
+        # the lower-cased name and create each group in order
+        groups = {}
+        for index, workspace in enumerate(workspaces):
+            groups.setdefault(workspace.workspace_name.lower(), []).append(index)
+
+        errors = [None] * len(workspaces)
+
+        def create_group(indices: List[int]) -> None:
+            for index in indices:
+                try:
+                    workspaces[index].create()
+                except Exception as e:
+                    errors[index] = e
+
+        # Each create is a blocking round trip, so overlap the groups on a thread pool
+        with ThreadPoolExecutor(max_workers=min(MAX_REQUEST_WORKERS, len(groups))) as executor:
+            list(executor.map(create_group, groups.values()))
+        self.invalidate_list_cache()
+
+        created_workspaces = [workspace for workspace, e in zip(workspaces, errors) if e is None]
+        error = next((e for e in errors if e is not None), None)
+
+        # Workspaces that were created are kept even if another one failed
+        self.workspaces.update({workspace.workspace_slug: workspace for workspace in created_workspaces})
+        if error is not None:
+            raise error
 
         return created_workspaces
 
@@ -76,19 +230,59 @@ class WorkspaceManager:
         """
         return self.workspaces.get(slug)
 
+    def find_workspaces(self, chat_mode: str = None, min_temperature: float = None, max_temperature: float = None,
+                        min_top_n: int = None) -> List[Workspace]:
+        """
+        Find the managed workspaces matching all of the given settings.
+
+        Args:
+            chat_mode (str, optional): Required chat mode. Defaults to None (any).
+            min_temperature (float, optional): Lowest temperature to include. Defaults to None (no bound).
+            max_temperature (float, optional): Highest temperature to include. Defaults to None (no bound).
+            min_top_n (int, optional): Lowest top_n to include. Defaults to None (no bound).
+
+        Returns:
+            List[Workspace]: Matching workspace objects
+        """
+        # Only the requested criteria are checked per workspace; unset settings never match a bound
+        checks = []
+        if chat_mode is not None:
+            checks.append(lambda w: w.chat_mode == chat_mode)
+        if min_temperature is not None:
+            checks.append(lambda w: w.temperature is not None and w.temperature >= min_temperature)
+        if max_temperature is not None:
+            checks.append(lambda w: w.temperature is not None and w.temperature <= max_temperature)
+        if min_top_n is not None:
+            checks.append(lambda w: w.top_n is not None and w.top_n >= min_top_n)
+
+        return [workspace for workspace in self.workspaces.values() if all(check(workspace) for check in checks)]
+
     def list_workspaces(self) -> List[Dict[str, Any]]:
         """
         List all workspaces from the API.
 
+        The result is reused for LIST_CACHE_TTL seconds; creating or deleting a workspace through
+        this manager invalidates it.
+
         Returns:
             List[Dict[str, Any]]: List of workspace details
 
         Raises:
             APIError: If the API request fails
         """
-        api_client = APIClient(base_endpoint=self.base_endpoint, api_key=self.api_key)
-        data = api_client.get("v1/workspaces")
-        return data.get('workspaces', [])
+        now = time.monotonic()
+        if self._list_cache is not None and now - self._list_cache_ts < self._list_ttl:
+            return list(self._list_cache)
+
+        data = self._api_client.get("v1/workspaces")
+
+        self._list_cache = data.get('workspaces', [])
+        self._list_cache_ts = now
+        return list(self._list_cache)
+
+    def invalidate_list_cache(self) -> None:
+        """Discard the cached list_workspaces result so the next call queries the API."""
+        self._list_cache = None
 
     def load_workspaces(self) -> Dict[str, Workspace]:
         """
@@ -99,31 +293,22 @@ class WorkspaceManager:
         """
         workspaces_data = self.list_workspaces()
 
-        for workspace_data in workspaces_data:
-            slug = workspace_data.get('slug')
-            if slug and slug not in self.workspaces:
-                # Create a workspace object with the data from the API
-                workspace = Workspace(
-                    workspace_name=workspace_data.get('name', ''),
-                    custom_prompt=workspace_data.get('openAiPrompt', ''),
-                    temperature=workspace_data.get('openAiTemp', 0.7),
-                    similarity_threshold=workspace_data.get('similarityThreshold', 0.7),
-                    history_count=workspace_data.get('openAiHistory', 20),
-                    query_refusal_response=workspace_data.get('queryRefusalResponse', ''),
-                    chat_mode=workspace_data.get('chatMode', 'chat'),
-                    top_n=workspace_data.get('topN', 4),
-                    base_endpoint=self.base_endpoint,
-                    api_key=self.api_key
-                )
-
-                # Set the workspace ID and slug
-                workspace.workspace_id = workspace_data.get('id')
-                workspace.workspace_slug = slug
-
-                # Add to the workspaces dictionary
-                self.workspaces[slug] = workspace
-
-        return self.workspaces
+        # Only workspaces not already known to the manager are added. The set difference makes the
+        # common case, where nothing is new, a single C-level operation
+        existing = self.workspaces
+        api_by_slug = {workspace_data['slug']: workspace_data
+                       for workspace_data in workspaces_data if workspace_data.get('slug')}
+        new_slugs = api_by_slug.keys() - existing.keys()
+        if new_slugs:
+            from_api_dict = Workspace.from_api_dict
+            base_endpoint, api_key, api_client = self.base_endpoint, self.api_key, self._api_client
+            # Walk api_by_slug rather than the set to keep the API's order
+            existing.update({
+                slug: from_api_dict(workspace_data, base_endpoint, api_key, api_client)
+                for slug, workspace_data in api_by_slug.items() if slug in new_slugs
+            })
+
+        return existing
 
     def delete_workspace(self, slug: str) -> bool:
         """
@@ -135,27 +320,67 @@ class WorkspaceManager:
         Returns:
             bool: True if deletion was successful
         """
-        workspace = self.get_workspace(slug)
-        if workspace:
-            result = workspace.delete()
-            if result:
-                del self.workspaces[slug]
-            return result
+        workspace = self.workspaces.get(slug)
+        if workspace is None:
+            return False
+        if workspace.delete():
+            self.workspaces.pop(slug, None)
+            self.invalidate_list_cache()
+            return True
         return False
 
-    def save_workspaces_to_json(self, file_path: str) -> None:
+    def delete_workspaces(self, slugs: List[str]) -> Dict[str, bool]:
+        """
+        Delete several workspaces by their slugs, overlapping the requests on a thread pool.
+
+        Args:
+            slugs (List[str]): Workspace slugs
+
+        Returns:
+            Dict[str, bool]: Whether each workspace was deleted, keyed by slug; unknown slugs map to False
+
+        Raises:
+            APIError: If any deletion fails, after the others have completed
+        """
+        results = {slug: False for slug in slugs}
+        targets = [(slug, self.workspaces[slug]) for slug in results if slug in self.workspaces]
+        if not targets:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(MAX_REQUEST_WORKERS, len(targets))) as executor:
+            futures = [executor.submit(workspace.delete) for _, workspace in targets]
+        self.invalidate_list_cache()
+
+        error = None
+        for (slug, _), future in zip(targets, futures):
+            try:
+                results[slug] = future.result()
+            except Exception as e:
+                error = error or e
+
+        # Workspaces that were deleted are dropped even if another deletion failed
+        for slug, deleted in results.items():
+            if deleted:
+                self.workspaces.pop(slug, None)
+        if error is not None:
+            raise error
+
+        return results
+
+    def save_workspaces_to_json(self, file_path: str, pretty: bool = False) -> None:
         """
         Save all workspaces to a JSON file.
 
         Args:
             file_path (str): Path to save the JSON file
+            pretty (bool, optional): Indent the file for reading by humans; compact output is smaller
+                and faster to write. Defaults to False.
         """
-        configs = []
-        for workspace in self.workspaces.values():
-            configs.append(workspace.to_json())
+        configs = [workspace.to_json() for workspace in self.workspaces.values()]
 
-        with open(file_path, 'w') as f:
-            json.dump(configs, f, indent=2)
+        # Encode the whole document once and write it in a single call
+        with open(file_path, 'wb') as f:
+            f.write(json_utils.dumps(configs, pretty=pretty))
 
     def __str__(self) -> str:
         """
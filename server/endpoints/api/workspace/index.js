@@ -98,6 +98,138 @@ function apiWorkspaceEndpoints(app) {
     }
   });
 
+  app.post(
+    "/v1/workspace/bulk-new",
+    [validApiKey],
+    async (request, response) => {
+      /*
+    #swagger.tags = ['Workspaces']
+    #swagger.description = 'Create multiple workspaces in a single request. Either every workspace is created or, if any of them fails, none are.'
+    #swagger.requestBody = {
+      description: 'JSON object containing a list of workspace configurations.',
+      required: true,
+      content: {
+        "application/json": {
+          example: {
+            workspaces: [
+              {
+                name: "My New Workspace",
+                similarityThreshold: 0.7,
+                openAiTemp: 0.7,
+                openAiHistory: 20,
+                openAiPrompt: "Custom prompt for responses",
+                queryRefusalResponse: "Custom refusal message",
+                chatMode: "chat",
+                topN: 4
+              }
+            ]
+          }
+        }
+      }
+    }
+    #swagger.responses[200] = {
+      content: {
+        "application/json": {
+          schema: {
+            type: 'object',
+            example: {
+              workspaces: [
+                {
+                  "id": 79,
+                  "name": "Sample workspace",
+                  "slug": "sample-workspace",
+                  "createdAt": "2023-08-17 00:45:03",
+                  "openAiTemp": null,
+                  "lastUpdatedAt": "2023-08-17 00:45:03",
+                  "openAiHistory": 20,
+                  "openAiPrompt": null
+                }
+              ],
+              message: null
+            }
+          }
+        }
+      }
+    }
+    #swagger.responses[403] = {
+      schema: {
+        "$ref": "#/definitions/InvalidAPIKey"
+      }
+    }
+    */
+      // All-or-nothing: workspaces created before a failure are removed again.
+      const workspaces = [];
+      let created = false;
+      const rollback = async () => {
+        for (const workspace of workspaces)
+          await Workspace.delete({ id: Number(workspace.id) });
+        workspaces.length = 0;
+      };
+
+      try {
+        const { workspaces: configs = [] } = reqBody(request);
+        if (!Array.isArray(configs) || configs.length === 0) {
+          response.status(400).json({
+            workspaces: [],
+            message: "workspaces must be a non-empty array",
+          });
+          return;
+        }
+
+        const invalidIndex = configs.findIndex(
+          (config) =>
+            !config || typeof config !== "object" || Array.isArray(config)
+        );
+        if (invalidIndex !== -1) {
+          response.status(400).json({
+            workspaces: [],
+            message: `workspaces[${invalidIndex}] must be an object`,
+          });
+          return;
+        }
+
+        for (const [index, config] of configs.entries()) {
+          const { name = null, ...additionalFields } = config;
+          const { workspace, message } = await Workspace.new(
+            name,
+            null,
+            additionalFields
+          );
+
+          if (!workspace) {
+            await rollback();
+            response.status(400).json({
+              workspaces: [],
+              message: `workspaces[${index}]: ${message}`,
+            });
+            return;
+          }
+          workspaces.push(workspace);
+        }
+        created = true;
+
+        await Telemetry.sendTelemetry("workspace_created", {
+          multiUserMode: multiUserMode(response),
+          LLMSelection: process.env.LLM_PROVIDER || "openai",
+          Embedder: process.env.EMBEDDING_ENGINE || "inherit",
+          VectorDbSelection: process.env.VECTOR_DB || "lancedb",
+          TTSSelection: process.env.TTS_PROVIDER || "native",
+        });
+        for (const workspace of workspaces) {
+          await EventLogs.logEvent("api_workspace_created", {
+            workspaceName: workspace?.name || "Unknown Workspace",
+          });
+        }
+        response.status(200).json({ workspaces, message: null });
+      } catch (e) {
+        console.error(e.message, e);
+        if (!created)
+          await rollback().catch((error) => console.error(error.message));
+        response.sendStatus(500).end();
+      }
+    }
+  );
+
   app.get("/v1/workspaces", [validApiKey], async (request, response) => {
     /*
     #swagger.tags = ['Workspaces']